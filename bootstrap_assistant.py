@@ -0,0 +1,11 @@
+"""Create the News Summarizer assistant once and print its ID.
+
+Set the printed ID as OPENAI_ASSISTANT_ID so the app retrieves this
+assistant instead of creating a new one.
+"""
+from main import AssistantManager
+
+if __name__ == "__main__":
+    manager = AssistantManager()
+    assistant = manager._new_assistant(manager.ASSISTANT_CONFIG)
+    print(assistant.id)
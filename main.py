@@ -1,67 +1,430 @@
 import os
+import re
+import hashlib
 from openai import OpenAI
+from openai.types.beta import Assistant
+from openai.types.beta.threads.run import RequiredActionSubmitToolOutputs
 from dotenv import load_dotenv
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+import ijson
+import orjson
 import time
+import asyncio
+import random
 from datetime import datetime, timedelta
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import atexit
+from collections import Counter
+from functools import lru_cache
 import streamlit as st
-from typing import Optional, List, Dict
+from cachetools import TTLCache, LRUCache
+import diskcache
+from typing import Optional, List, Dict, Tuple, Callable, Iterator
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 load_dotenv()
 
+# Per-user directory for the news cache and topic request counts
+_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "news-summarizer")
+
+# (output field, NewsAPI field, fallback) for each article attribute passed to the model
+_ARTICLE_FIELDS = (
+    ("title", "title", "No title"),
+    ("description", "description", "No description"),
+    ("url", "url", "No URL"),
+    ("published_at", "publishedAt", "Unknown date"),
+)
+
+def _truncate(text: str, limit: int = 300) -> str:
+    """Cut text to at most `limit` characters, breaking at a word boundary."""
+    if len(text) <= limit:
+        return text
+    return text[:limit - 3].rsplit(" ", 1)[0] + "..."
+
+# Trailing " - Source" / " | Source" that NewsAPI titles usually end with
+_SOURCE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+
+def _dedup_articles(articles: List[Dict], threshold: float = 0.8) -> List[Dict]:
+    """Collapse articles with near-identical titles, e.g. syndicated wire stories.
+    
+    Titles are compared by the Jaccard similarity of their words, ignoring the
+    trailing " - Source" or " | Source" NewsAPI appends; of two duplicates, the
+    one with the longer title and description is kept.
+    
+    >>> titles = ["Fed holds interest rates steady - Reuters",
+    ...           "Fed holds interest rates steady - CNBC",
+    ...           "Fed holds interest rates steady | Bloomberg"]
+    >>> len(_dedup_articles([{"title": t, "description": ""} for t in titles]))
+    1
+    """
+    kept = []
+    kept_words = []
+    for article in articles:
+        headline = _SOURCE_SUFFIX.sub("", article["title"])
+        words = set(re.findall(r"\w+", headline.lower()))
+        for i, seen in enumerate(kept_words):
+            if words and seen and len(words & seen) / len(words | seen) >= threshold:
+                if _article_length(article) > _article_length(kept[i]):
+                    kept[i] = article
+                    kept_words[i] = words
+                break
+        else:
+            kept.append(article)
+            kept_words.append(words)
+    return kept
+
+def _article_length(article: Dict) -> int:
+    return len(article["title"]) + len(article["description"])
+
+def _prepare_for_prompt(articles: List[Dict]) -> List[Dict]:
+    """Deduplicate and truncate articles to keep the tool output, and so the prompt, small."""
+    return [
+        {**article, "description": _truncate(article["description"])}
+        for article in _dedup_articles(articles)
+    ]
+
+def _default_start_date() -> str:
+    """Default news window: the last seven days."""
+    return _start_date_for_bucket(datetime.now().strftime("%Y-%m-%d-%H"))
+
+@lru_cache(maxsize=32)
+def _start_date_for_bucket(date_bucket: str) -> str:
+    """Compute the default start date once per hourly bucket."""
+    return (datetime.strptime(date_bucket, "%Y-%m-%d-%H") - timedelta(days=7)).strftime("%Y-%m-%d")
+
+class TopicCache:
+    """Two-tier news cache.
+    
+    A small static segment holds the most frequently requested recent topics
+    and, once start() is called, is refreshed in the background on a timer so
+    popular topics never age out. Request counts decay at every refresh, and
+    only topics asked for at least `min_count` times since roughly the last
+    refresh are promoted, keeping timer traffic within NewsAPI's daily quota.
+    Everything else goes through a dynamic LRU segment with a TTL, written
+    through to a disk cache so entries survive process restarts.
+    """
+    def __init__(self, fetch: Callable[[str, str], Optional[List[Dict]]], dynamic_size: int = 256,
+                 static_size: int = 2, ttl: int = 1800, refresh_interval: int = 3 * 3600,
+                 min_count: int = 3, decay: float = 0.5, counts_path: str = None,
+                 disk_path: str = None):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.static_size = static_size
+        self.refresh_interval = refresh_interval
+        self.min_count = min_count
+        self.decay = decay
+        self.counts_path = counts_path or os.environ.get(
+            "NEWS_TOPIC_COUNTS_PATH", os.path.join(_CACHE_DIR, "topic_counts.pkl")
+        )
+        self.static: Dict[Tuple[str, str], List[Dict]] = {}
+        self.dynamic = TTLCache(maxsize=dynamic_size, ttl=ttl)
+        self.disk = diskcache.Cache(
+            disk_path or os.environ.get("NEWS_CACHE_DIR", _CACHE_DIR),
+            size_limit=128 * 2**20
+        )
+        self.counts = self._load_counts()
+        self.lock = threading.Lock()
+        self._timer = None
+        
+    def start(self) -> None:
+        """Start refreshing the static segment in the background."""
+        if self._timer is None:
+            atexit.register(self._save_counts)
+            self._schedule_refresh(self.refresh_interval)
+            
+    def close(self) -> None:
+        """Stop the background refresh, save the request counts and close the disk cache."""
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            atexit.unregister(self._save_counts)
+        self._save_counts()
+        self.disk.close()
+        
+    def get(self, key: Tuple[str, str]) -> Optional[List[Dict]]:
+        """Look up a (topic, start_date) key in the static segment, the dynamic one, then on disk."""
+        with self.lock:
+            self.counts[key[0]] += 1
+            articles = self.static.get(key)
+            if articles is None:
+                articles = self.dynamic.get(key)
+        if articles is None:
+            # Served straight from disk: promoting it would restart its TTL in memory
+            articles = self.disk.get(self._disk_key(key))
+        return articles
+        
+    def put(self, key: Tuple[str, str], articles: List[Dict]) -> None:
+        with self.lock:
+            self.dynamic[key] = articles
+        self.disk.set(self._disk_key(key), articles, expire=self.ttl)
+        
+    @staticmethod
+    def _disk_key(key: Tuple[str, str]) -> str:
+        return "|".join(key)
+            
+    def refresh(self) -> None:
+        """Re-fetch the top topics into the static segment and reschedule."""
+        try:
+            with self.lock:
+                top_topics = [
+                    topic for topic, count in self.counts.most_common(self.static_size)
+                    if count >= self.min_count
+                ]
+                previous = dict(self.static)
+                # Decay counts so the ranking reflects recent requests, forgetting one-off topics
+                self.counts = Counter({
+                    topic: count * self.decay
+                    for topic, count in self.counts.items()
+                    if count * self.decay >= 1
+                })
+            start_date = _default_start_date()
+            static = {}
+            for topic in top_topics:
+                key = (topic, start_date)
+                articles = self.fetch(topic, start_date)
+                if articles is None:
+                    articles = previous.get(key)
+                if articles is not None:
+                    static[key] = articles
+            with self.lock:
+                self.static = static
+            logging.info(f"Static news cache refreshed for {len(static)} topics")
+            self._save_counts()
+        except Exception as e:
+            logging.error(f"Error refreshing static news cache: {e}")
+        finally:
+            if self._timer is not None:
+                self._schedule_refresh(self.refresh_interval)
+            
+    def _schedule_refresh(self, delay: float) -> None:
+        self._timer = threading.Timer(delay, self.refresh)
+        self._timer.daemon = True
+        self._timer.start()
+        
+    def _load_counts(self) -> Counter:
+        try:
+            with open(self.counts_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return Counter()
+        except Exception as e:
+            logging.warning(f"Could not load topic counts: {e}")
+            return Counter()
+            
+    def _save_counts(self) -> None:
+        try:
+            with self.lock:
+                counts = Counter(self.counts)
+            os.makedirs(os.path.dirname(self.counts_path) or ".", exist_ok=True)
+            with open(self.counts_path, "wb") as f:
+                pickle.dump(counts, f)
+        except Exception as e:
+            logging.warning(f"Could not save topic counts: {e}")
+
+class RateLimiter:
+    """Token bucket that spaces out requests to stay under the API's rate limit."""
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+        
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
 class NewsAPIClient:
-    def __init__(self):
+    def __init__(self, requests_per_period_limit: int = 5, request_period_in_seconds: float = 10,
+                 max_concurrency: int = 4, static_size: int = 2, refresh_interval: int = 3 * 3600):
         self.api_key = os.environ.get("NEWS_API_KEY")
         if not self.api_key:
             raise ValueError("NEWS_API_KEY not found in environment variables")
         self.base_url = 'https://newsapi.org/v2/everything'
+        # Pooled session keeps the TLS connection to the API alive between calls
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        self.session.headers.update({'User-Agent': 'news-summarizer/1.0', 'Accept-Encoding': 'gzip, deflate'})
+        # Queue bursts locally rather than tripping the API's 429s
+        self.sema = threading.BoundedSemaphore(max_concurrency)
+        self.bucket = RateLimiter(
+            rate=requests_per_period_limit / request_period_in_seconds,
+            capacity=requests_per_period_limit
+        )
+        # Validators for conditional requests, kept beyond the cache TTL
+        self.validators = LRUCache(maxsize=256)
+        self.validators_lock = threading.Lock()
+        # Cache results per (topic, start_date) so repeated queries skip the round trip
+        self.cache = TopicCache(
+            fetch=self._fetch_news,
+            static_size=static_size,
+            refresh_interval=refresh_interval
+        )
+        
+    def get_news(self, topic: str, start_date: str = None) -> List[Dict]:
+        if not start_date:
+            start_date = _default_start_date()
+            
+        key = (topic.lower().strip(), start_date)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logging.info(f"News cache hit for topic: {topic}")
+            return list(cached)
+            
+        articles = self._fetch_news(topic, start_date)
+        if articles is None:
+            return []
+        self.cache.put(key, articles)
+        return list(articles)
+        
+    def get_news_batch(self, topics: List[str], start_date: str = None,
+                       fetch_unmatched: bool = False) -> Dict[str, List[Dict]]:
+        """Fetch news for several topics with one OR query and split the articles back per topic.
         
-    def get_news(self, topic: str, start_date: str = None) -> List[str]:
+        Topics the batch returns no articles for stay empty unless `fetch_unmatched`
+        is set, in which case they get their own request.
+        """
         if not start_date:
-            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+            start_date = _default_start_date()
             
+        results = {}
+        missing = []
+        for topic in dict.fromkeys(topics):
+            cached = self.cache.get((topic.lower().strip(), start_date))
+            if cached is not None:
+                logging.info(f"News cache hit for topic: {topic}")
+                results[topic] = list(cached)
+            else:
+                missing.append(topic)
+                
+        if len(missing) > 1:
+            # Quotes inside a topic would unbalance the phrase syntax, so drop them
+            query = " OR ".join('"' + topic.replace('"', '') + '"' for topic in missing)
+            articles = self._fetch_news(query, start_date, page_size=min(100, 5 * len(missing)))
+            for topic in missing:
+                needle = topic.lower().strip()
+                # Match whole words so a short topic like "AI" does not match "said" or "again"
+                pattern = re.compile(rf"(?<!\w){re.escape(needle)}(?!\w)")
+                matched = [
+                    article for article in articles or []
+                    if any(pattern.search(article[field].lower()) for field in ("title", "description"))
+                ][:5]
+                # Only a full page stands in for the topic's own request in the cache
+                if len(matched) >= 5:
+                    self.cache.put((needle, start_date), matched)
+                if matched or not fetch_unmatched:
+                    results[topic] = list(matched)
+                    
+        # A lone uncached topic, or unmatched ones when asked for, are fetched on their own
+        fallback = [topic for topic in missing if topic not in results]
+        if fallback:
+            with ThreadPoolExecutor(max_workers=min(len(fallback), 8)) as executor:
+                fetched = executor.map(lambda topic: self._fetch_news(topic, start_date), fallback)
+                for topic, articles in zip(fallback, fetched):
+                    if articles is not None:
+                        self.cache.put((topic.lower().strip(), start_date), articles)
+                    results[topic] = list(articles or [])
+        return results
+        
+    def _fetch_news(self, topic: str, start_date: str, page_size: int = 5) -> Optional[List[Dict]]:
+        """Fetch news from the API, returning None if the request fails."""
         params = {
             'q': topic,
             'from': start_date,
             'sortBy': 'popularity',
             'apiKey': self.api_key,
-            'pageSize': 5
+            'pageSize': page_size
         }
         
+        # Revalidate earlier results so an unchanged response comes back as an empty 304
+        validator_key = (topic.lower().strip(), start_date, page_size)
+        with self.validators_lock:
+            validator = self.validators.get(validator_key)
+        headers = {}
+        if validator:
+            if validator["last_modified"]:
+                headers['If-Modified-Since'] = validator["last_modified"]
+            if validator["etag"]:
+                headers['If-None-Match'] = validator["etag"]
+        
         try:
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            return [self._format_article(article) for article in data.get("articles", [])]
+            # The body is read while holding the semaphore so it bounds downloads, not just headers
+            with self.sema:
+                self.bucket.acquire()
+                with self.session.get(
+                    self.base_url, params=params, headers=headers, timeout=(3.05, 10), stream=True
+                ) as response:
+                    if response.status_code == 304 and validator:
+                        # Callers put the articles back into the cache, restarting their freshness window
+                        logging.info(f"News not modified for query: {topic}")
+                        return validator["articles"]
+                    response.raise_for_status()
+                    if page_size <= 5:
+                        # Small pages parse fastest in one go with orjson
+                        raw_articles = orjson.loads(response.content).get("articles", [])
+                    else:
+                        # Large batched pages are parsed one article at a time off the wire
+                        response.raw.decode_content = True
+                        raw_articles = ijson.items(response.raw, 'articles.item')
+                    articles = [self._format_article(article) for article in raw_articles]
+                
+            last_modified = response.headers.get('Last-Modified')
+            etag = response.headers.get('ETag')
+            if last_modified or etag:
+                with self.validators_lock:
+                    self.validators[validator_key] = {
+                        "articles": articles,
+                        "last_modified": last_modified,
+                        "etag": etag,
+                    }
+            return articles
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError,
+                orjson.JSONDecodeError, ijson.JSONError) as e:
             logging.error(f"Error occurred during API Request: {e}")
-            return []
+            return None
             
-    def _format_article(self, article: Dict) -> str:
-        return f"""
-        Source: {article.get("source", {}).get("name", "Unknown")},
-        Title: {article.get("title", "No title")},
-        Description: {article.get("description", "No description")},
-        URL: {article.get("url", "No URL")},
-        Content: {article.get("content", "No content")},
-        Published At: {article.get("publishedAt", "Unknown date")}
-        """
+    def _format_article(self, article: Dict) -> Dict:
+        formatted = {
+            field: article.get(api_field) or default
+            for field, api_field, default in _ARTICLE_FIELDS
+        }
+        formatted["source"] = (article.get("source") or {}).get("name") or "Unknown"
+        return formatted
 
 class AssistantManager:
-    def __init__(self, model: str = 'gpt-3.5-turbo-16k'):
+    # Assistants created in this process, keyed by a hash of their config and model
+    _assistant_by_hash: Dict[str, Assistant] = {}
+    _assistant_lock = threading.Lock()
+    
+    def __init__(self, model: str = 'gpt-3.5-turbo-16k', news_client: NewsAPIClient = None):
         self.client = OpenAI()
         self.model = model
         self.assistant = None
         self.thread = None
         self.run = None
         self.summary = None
-        self.news_client = NewsAPIClient()
+        self._news_client = news_client
         
         # Configuration
         self.ASSISTANT_CONFIG = {
@@ -93,21 +456,58 @@ class AssistantManager:
             ]
         }
     
+    @property
+    def news_client(self) -> NewsAPIClient:
+        """The news client, created on first use so assistant-only callers do not need NEWS_API_KEY."""
+        if self._news_client is None:
+            self._news_client = NewsAPIClient()
+        return self._news_client
+        
     def create_assistant(self, custom_config: Dict = None) -> None:
-        """Creates an OpenAI assistant with given or default configuration."""
+        """Creates an OpenAI assistant with given or default configuration.
+        
+        Assistants are shared by every manager in the process with the same
+        config and model. The default one is retrieved by ID instead of
+        created when OPENAI_ASSISTANT_ID is set and names an assistant on the
+        same model.
+        """
         if self.assistant is None:
             try:
                 config = custom_config or self.ASSISTANT_CONFIG
-                self.assistant = self.client.beta.assistants.create(
-                    name=config["name"],
-                    instructions=config["instructions"],
-                    tools=config["tools"],
-                    model=self.model
-                )
-                logging.info(f"Assistant created: {self.assistant.id}")
+                config_hash = hashlib.blake2b(
+                    orjson.dumps({"config": config, "model": self.model}, option=orjson.OPT_SORT_KEYS),
+                    digest_size=8
+                ).hexdigest()
+                with AssistantManager._assistant_lock:
+                    assistant = AssistantManager._assistant_by_hash.get(config_hash)
+                    if assistant is None:
+                        assistant_id = os.environ.get("OPENAI_ASSISTANT_ID")
+                        if assistant_id and not custom_config:
+                            assistant = self.client.beta.assistants.retrieve(assistant_id)
+                            logging.info(f"Assistant retrieved: {assistant_id}")
+                            # The pinned assistant only stands in for managers using its model
+                            if assistant.model != self.model:
+                                logging.info(
+                                    f"Pinned assistant uses {assistant.model}, not {self.model}; creating a new one"
+                                )
+                                assistant = None
+                        if assistant is None:
+                            assistant = self._new_assistant(config)
+                        AssistantManager._assistant_by_hash[config_hash] = assistant
+                    self.assistant = assistant
             except Exception as e:
                 logging.error(f"Error creating assistant: {e}")
                 raise
+                
+    def _new_assistant(self, config: Dict) -> Assistant:
+        assistant = self.client.beta.assistants.create(
+            name=config["name"],
+            instructions=config["instructions"],
+            tools=config["tools"],
+            model=self.model
+        )
+        logging.info(f"Assistant created: {assistant.id}")
+        return assistant
 
     def process_news_request(self, topic: str, custom_instructions: str = None) -> Optional[str]:
         """Process a news summarization request end-to-end."""
@@ -122,6 +522,49 @@ class AssistantManager:
             logging.error(f"Error processing news request: {e}")
             return None
 
+    def stream_news_request(self, topic: str, custom_instructions: str = None) -> Iterator[str]:
+        """Process a news summarization request, yielding the summary text as it is generated."""
+        self.create_thread()
+        self.create_assistant()
+        self.add_message_to_thread("user", f"summarize the news on this topic {topic}")
+        self.summary = None
+        
+        chunks = []
+        stream_manager = self.client.beta.threads.runs.stream(
+            thread_id=self.thread.id,
+            assistant_id=self.assistant.id,
+            instructions=custom_instructions or self.ASSISTANT_CONFIG["run_instructions"]
+        )
+        # Submitting tool outputs pauses the run and continues it on a new stream
+        while stream_manager is not None:
+            with stream_manager as stream:
+                stream_manager = None
+                for event in stream:
+                    if event.event == "thread.run.created":
+                        self.run = event.data
+                        logging.info(f"Run created: {self.run.id}")
+                    elif event.event == "thread.message.delta":
+                        for block in event.data.delta.content or []:
+                            if block.type == "text" and block.text and block.text.value:
+                                chunks.append(block.text.value)
+                                yield block.text.value
+                    elif event.event == "thread.run.requires_action":
+                        self.run = event.data
+                        tool_outputs = self._collect_tool_outputs(event.data.required_action.submit_tool_outputs)
+                        logging.info("Submitting tool outputs to assistant")
+                        stream_manager = self.client.beta.threads.runs.submit_tool_outputs_stream(
+                            thread_id=self.thread.id,
+                            run_id=self.run.id,
+                            tool_outputs=tool_outputs
+                        )
+                    elif event.event in [
+                        "thread.run.failed", "thread.run.cancelled", "thread.run.expired", "thread.run.incomplete"
+                    ]:
+                        raise Exception(f"Run failed with status: {event.data.status}")
+                        
+        self.summary = ''.join(chunks)
+        logging.info("Summary streamed from assistant")
+
     def create_thread(self) -> None:
         """Create a new thread for the assistant."""
         if not self.thread:
@@ -165,31 +608,13 @@ class AssistantManager:
             logging.error(f"Error running assistant: {e}")
             raise
     
-    def handle_required_actions(self, required_actions: Dict) -> None:
+    def handle_required_actions(self, submit_tool_outputs: RequiredActionSubmitToolOutputs) -> None:
         """Handles any required actions from the assistant, such as function calls."""
         if not self.run:
             raise ValueError("Run not initialized")
             
-        tool_outputs = []
-        
         try:
-            for action in required_actions["tool_calls"]:
-                tool_call_id = action['id']
-                func_name = action['function']['name']
-                func_args = json.loads(action['function']['arguments'])
-                
-                if func_name == "get_news":
-                    output = self.news_client.get_news(
-                        topic=func_args['topic'],
-                        start_date=func_args.get('start_date')
-                    )
-                    tool_outputs.append({
-                        "tool_call_id": tool_call_id,
-                        "output": json.dumps(''.join(output))
-                    })
-                else:
-                    raise ValueError(f"Unknown function: {func_name}")
-                    
+            tool_outputs = self._collect_tool_outputs(submit_tool_outputs)
             logging.info("Submitting tool outputs to assistant")
             self.client.beta.threads.runs.submit_tool_outputs(
                 thread_id=self.thread.id,
@@ -201,6 +626,35 @@ class AssistantManager:
             logging.error(f"Error handling required actions: {e}")
             raise
 
+    def _collect_tool_outputs(self, submit_tool_outputs: RequiredActionSubmitToolOutputs) -> List[Dict]:
+        """Runs the requested function calls and returns their outputs for submission."""
+        news_calls = []
+        for action in submit_tool_outputs.tool_calls:
+            func_name = action.function.name
+            if func_name != "get_news":
+                raise ValueError(f"Unknown function: {func_name}")
+            news_calls.append((action.id, orjson.loads(action.function.arguments)))
+
+        # Topics sharing a start date go out as one batched query; the batches run concurrently
+        topics_by_date: Dict[Optional[str], List[str]] = {}
+        for _, func_args in news_calls:
+            topics_by_date.setdefault(func_args.get('start_date'), []).append(func_args['topic'])
+        with ThreadPoolExecutor(max_workers=max(1, min(len(topics_by_date), 8))) as executor:
+            batches = dict(zip(topics_by_date, executor.map(
+                lambda item: self.news_client.get_news_batch(item[1], start_date=item[0]),
+                topics_by_date.items()
+            )))
+        tool_outputs = [
+            {
+                "tool_call_id": tool_call_id,
+                "output": orjson.dumps({
+                    "articles": _prepare_for_prompt(batches[func_args.get('start_date')][func_args['topic']])
+                }).decode()
+            }
+            for tool_call_id, func_args in news_calls
+        ]
+        return tool_outputs
+
     def process_messages(self) -> None:
         """Processes messages from the thread and extracts the summary."""
         if not self.thread:
@@ -225,18 +679,38 @@ class AssistantManager:
             logging.error(f"Error processing messages: {e}")
             raise
             
-    def wait_for_completion(self, interval: int = 2, timeout: int = 100) -> None:
-        """Wait for the assistant's run to complete with improved error handling."""
+    def wait_for_completion(self, initial_interval: float = 0.25, max_interval: float = 5.0,
+                            multiplier: float = 2.0, timeout: int = 100) -> None:
+        """Wait for the assistant's run to complete, polling with exponential backoff and jitter.
+        
+        Async callers should await `await_completion` directly instead.
+        """
+        coro = self.await_completion(initial_interval, max_interval, multiplier, timeout)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coro)
+            return
+        # A loop is already running in this thread (e.g. Jupyter), so poll on a worker thread's own loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(asyncio.run, coro).result()
+        
+    async def await_completion(self, initial_interval: float = 0.25, max_interval: float = 5.0,
+                               multiplier: float = 2.0, timeout: int = 100) -> None:
+        """Poll the run without blocking the event loop, so other coroutines can progress meanwhile."""
         if not (self.thread and self.run):
             raise ValueError("Thread or Run not initialized")
             
         start_time = time.time()
+        delay = initial_interval
         while True:
             if time.time() - start_time > timeout:
                 raise TimeoutError("Assistant run timed out")
                 
-            time.sleep(interval)
-            run = self.client.beta.threads.runs.retrieve(
+            await asyncio.sleep(delay + random.uniform(0, 0.1))
+            delay = min(delay * multiplier, max_interval)
+            run = await asyncio.to_thread(
+                self.client.beta.threads.runs.retrieve,
                 thread_id=self.thread.id,
                 run_id=self.run.id
             )
@@ -244,19 +718,31 @@ class AssistantManager:
             logging.info(f"Run status: {run.status}")
             
             if run.status == "completed":
-                self.process_messages()
+                await asyncio.to_thread(self.process_messages)
                 break
             elif run.status == "requires_action":
-                self.handle_required_actions(run.required_action.submit_tool_outputs.model_dump())
-            elif run.status in ["failed", "cancelled", "expired"]:
+                await asyncio.to_thread(
+                    self.handle_required_actions,
+                    run.required_action.submit_tool_outputs
+                )
+                # Tool outputs were just submitted, so the run should resume shortly
+                delay = initial_interval
+            elif run.status in ["failed", "cancelled", "expired", "incomplete"]:
                 raise Exception(f"Run failed with status: {run.status}")
     
                 
+@st.cache_resource
+def get_news_client() -> NewsAPIClient:
+    """One news client per process so all sessions share its cache."""
+    news_client = NewsAPIClient()
+    news_client.cache.start()
+    return news_client
+
 def create_streamlit_app():
     st.set_page_config(page_title="News Summarizer", layout="wide")
     
     if "manager" not in st.session_state:
-        st.session_state.manager = AssistantManager()
+        st.session_state.manager = AssistantManager(news_client=get_news_client())
     
     st.title("📰 News Summarizer")
     
@@ -271,13 +757,12 @@ def create_streamlit_app():
     if submit and topic:
         with st.spinner("Fetching and summarizing news..."):
             try:
-                summary = st.session_state.manager.process_news_request(
+                summary = st.write_stream(st.session_state.manager.stream_news_request(
                     topic,
                     f"Summarize the last {days_ago} days of news about {topic}"
-                )
+                ))
                 if summary:
                     st.success("Summary generated successfully!")
-                    st.markdown(summary)
                 else:
                     st.error("Failed to generate summary. Please try again.")
             except Exception as e: